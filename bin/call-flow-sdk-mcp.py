@@ -3,6 +3,7 @@
 import json, shutil, subprocess, sys
 
 _MSG = "flowpad is not installed. Install with: pip install flowpad — then restart Claude Code."
+_CONTENT_LENGTH = "content-length:"
 _notified = False
 
 
@@ -20,7 +21,7 @@ def _read():
         text = line.decode().strip()
         if not text:
             continue
-        if text.lower().startswith("content-length:"):
+        if text[:len(_CONTENT_LENGTH)].lower() == _CONTENT_LENGTH:
             length = int(text.split(":", 1)[1])
             while sys.stdin.buffer.readline().strip():
                 pass
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from pathlib import Path
 
 import plugin_records
 from flow_sdk.fs_store import RecordRef, ResourceType, SyncOperation
@@ -20,11 +21,12 @@ from flow_sdk.fs_records import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResources:
     task: TaskResource
     process: AgenticProcess
     relationship: RelationshipRecord
+    record_dir: Path
 
 
 def start_new_analysis(session_id: str) -> AnalysisResources | None:
@@ -78,17 +80,22 @@ def start_new_analysis(session_id: str) -> AnalysisResources | None:
     send_entity_sync(SyncOperation.CREATE, process.to_dict())
     send_entity_sync(SyncOperation.CREATE, relationship.to_dict(), ResourceType.RELATIONSHIP)
 
-    return AnalysisResources(task=task, process=process, relationship=relationship)
+    return AnalysisResources(
+        task=task, process=process, relationship=relationship, record_dir=session.record_dir
+    )
 
 
 def complete_analysis(resources: AnalysisResources, session_id: str) -> None:
-    """Mark the analysis task as done and sync update to FlowPad."""
+    """Mark the analysis task as done and sync update to FlowPad.
+
+    The task is saved to the session record dir captured by start_new_analysis,
+    so the session is not looked up again; *session_id* is only logged.
+    """
     resources.task.status = TaskStatus.DONE
     resources.process.state = ProcessorStatus.COMPLETE
 
-    from plugin_records.skillit_records import skillit_records
-    session = skillit_records.get_session(session_id)
-    resources.task.save_to(session.record_dir)
+    resources.task.save_to(resources.record_dir)
+    skill_log("Completed analysis for session %s", session_id)
 
     send_entity_sync(SyncOperation.UPDATE, resources.task.to_dict())
     send_entity_sync(SyncOperation.UPDATE, resources.process.to_dict())
@@ -21,6 +21,12 @@ KEYWORD_MAPPINGS = [
     ("skillit:test", PLUGIN_DIR / "analyze_and_create_activation_rules.md", get_skill_rules_dir, True),
 ]
 
+# Compiled once per process, in the same order as KEYWORD_MAPPINGS.
+KEYWORD_PATTERNS = [
+    (re.compile(r'^\s*/?' + re.escape(entry[0]) + r'(?![/\\])', re.IGNORECASE), entry)
+    for entry in KEYWORD_MAPPINGS
+]
+
 
 def find_matching_keyword(prompt: str):
     """Find the first matching keyword entry for the prompt.
@@ -33,10 +39,8 @@ def find_matching_keyword(prompt: str):
     - Optionally prefixed with / as a command (e.g., /skillit:test)
     - Not inside file paths like /path/to/skillit/file.txt
     """
-    for entry in KEYWORD_MAPPINGS:
-        keyword = entry[0]
-        pattern = r'^\s*/?' + re.escape(keyword) + r'(?![/\\])'
-        if re.search(pattern, prompt, re.IGNORECASE):
+    for pattern, entry in KEYWORD_PATTERNS:
+        if pattern.search(prompt):
             return entry
     return None
 
@@ -1,5 +1,6 @@
 """SubagentStop hook handler — trigger skill installation when a skillit agent finishes."""
 
+import os
 from pathlib import Path
 
 from flow_sdk.fs_store import RecordStatus
@@ -11,13 +12,15 @@ from utils.log import skill_log
 
 def _get_ready_skill_folders(output_dir: Path) -> list[str]:
     """Return folder names of ready skills (directories containing SKILL.md)."""
-    if not output_dir.exists():
+    try:
+        with os.scandir(output_dir) as entries:
+            return [
+                entry.name
+                for entry in entries
+                if entry.is_dir() and os.path.exists(os.path.join(entry.path, "SKILL.md"))
+            ]
+    except FileNotFoundError:
         return []
-    return [
-        child.name
-        for child in output_dir.iterdir()
-        if child.is_dir() and (child / "SKILL.md").exists()
-    ]
 
 
 def handle(data: dict, rules_output: dict) -> dict | None:
@@ -47,8 +50,13 @@ def handle(data: dict, rules_output: dict) -> dict | None:
         skill_log(f"subagent_stop: no ready skills in {output_dir}, skipping (agent likely still in progress)")
         return rules_output or None
 
+    # Complete each folder's task, then install every ready skill in one pass
+    completed = False
     for folder_name in skill_folders:
         entity = {"type": RecordType.SKILL, "status": RecordStatus.NEW, "folder_name": folder_name}
-        SkillCreationHandler.on_update(session_id, session, RecordType.SKILL, entity)
+        if SkillCreationHandler.on_update(session_id, session, RecordType.SKILL, entity, copy_skills=False):
+            completed = True
+    if completed:
+        SkillCreationHandler.copy_ready_skills(session_id, session, folder_names=skill_folders)
 
     return rules_output or None
@@ -13,6 +13,16 @@ from utils.log import skill_log
 from skillit_events import send_skill_event
 from flow_sdk.rules import create_rule_engine
 
+# Bookkeeping keys the rule engine adds to its result; never part of hook output.
+_ENGINE_INTERNAL_KEYS = frozenset({"_exit_code", "_triggered_rules", "_chain_requests"})
+
+# hookEvent -> handler; events without an entry emit the rules output as-is.
+HOOK_HANDLERS = {
+    "UserPromptSubmit": prompt_submitted.handle,
+    "SessionStart": session_start.handle,
+    "SubagentStop": subagent_stop.handle,
+}
+
 
 def _emit_hook_output(output: dict) -> None:
     """Emit hook output to stdout in the format Claude Code expects.
@@ -40,11 +50,11 @@ def _emit_hook_output(output: dict) -> None:
     if is_blocking or not additional_context:
         # Blocking or structured output: emit as JSON
         json_str = json.dumps(output)
-        skill_log(f"Emitting JSON output ({len(json_str)} chars): {json_str[:300]}...")
+        skill_log("Emitting JSON output (%d chars): %.300s...", len(json_str), json_str)
         sys.stdout.write(json_str + "\n")
     else:
         # Context-only: emit as plain text (more prominent in Claude's view)
-        skill_log(f"Emitting plain text context ({len(additional_context)} chars): {additional_context[:200]}...")
+        skill_log("Emitting plain text context (%d chars): %.200s...", len(additional_context), additional_context)
         sys.stdout.write(additional_context + "\n")
     sys.stdout.flush()
 
@@ -116,13 +126,14 @@ def main():
     try:
         raw = sys.stdin.read()
         _dump_stdin(raw)
-        if not raw or not raw.strip():
+        stripped = raw.strip()
+        if not stripped:
           ERROR_MSG = "ERROR: No input received on stdin"
           skill_log(ERROR_MSG)
           sys.stdout.write(ERROR_MSG + "\n")
           sys.exit(1)
         data = json.loads(raw)
-        skill_log(f"Input received: {json.dumps(data)}")
+        skill_log("Input received: %s", stripped)
     except json.JSONDecodeError as e:
         skill_log(f"ERROR: Invalid JSON input: {e}")
         sys.exit(1)
@@ -131,8 +142,8 @@ def main():
     hookEvent = data.get("hook_event_name") or data.get("hookEvent") or "UserPromptSubmit"
     data["hookEvent"] = hookEvent  # normalize for downstream
 
-    skill_log(f"Hook triggered: {hookEvent}, path: {__file__}, pid: {os.getpid()}")
-    skill_log("Working directory: " + str(os.getcwd()))
+    skill_log("Hook triggered: %s, path: %s, pid: %d", hookEvent, __file__, os.getpid())
+    skill_log("Working directory: %s", os.getcwd())
     event_context = {
         "hookEvent": hookEvent,
         "scriptPath": __file__,
@@ -142,24 +153,21 @@ def main():
     send_skill_event("skillit hook invoke", event_context)
 
     prompt = data.get("prompt", "")
-    skill_log(f"Prompt: {prompt}")
+    skill_log("Prompt: %s", prompt)
 
     # Evaluate file-based rules from .flow/skill_rules/
     engine = create_rule_engine(project_dir=data.get("cwd"))
-    rules_output = engine.evaluate_rules(data, [])
-    rules_output.pop("_exit_code", None)
-    rules_output.pop("_triggered_rules", None)
-    rules_output.pop("_chain_requests", None)
+    rules_output = {
+        k: v for k, v in engine.evaluate_rules(data, []).items()
+        if k not in _ENGINE_INTERNAL_KEYS
+    }
     if rules_output:
-        skill_log(f"File rules triggered: {json.dumps(rules_output)}")
+        skill_log("File rules triggered: %s", rules_output)
 
     # Dispatch to handler
-    if hookEvent == "UserPromptSubmit":
-        output = prompt_submitted.handle(data, rules_output)
-    elif hookEvent == "SessionStart":
-        output = session_start.handle(data, rules_output)
-    elif hookEvent == "SubagentStop":
-        output = subagent_stop.handle(data, rules_output)
+    handler = HOOK_HANDLERS.get(hookEvent)
+    if handler is not None:
+        output = handler(data, rules_output)
     else:
         output = rules_output or None
 
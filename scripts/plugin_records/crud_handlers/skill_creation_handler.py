@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
+import traceback
 from dataclasses import dataclass
 
-from flow_sdk.fs_store import RecordRef, RecordStatus, ResourceType, SyncOperation
+from flow_sdk.fs_store import Record, RecordRef, RecordStatus, ResourceType, SyncOperation
 from flow_sdk.fs_store.record_types import RecordType
 from flow_sdk.discovery.notify import send_entity_sync
 from flow_sdk.fs_records import (
     AgenticProcess,
     ProcessorStatus,
     RelationshipRecord,
+    RelationshipType,
     TaskResource,
     TaskStatus,
     TaskType,
@@ -19,7 +21,7 @@ from flow_sdk.fs_records.skill_record import SkillRecord
 from utils.log import skill_log
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillCreationResources:
     task: TaskResource
     process: AgenticProcess
@@ -75,27 +77,31 @@ class SkillCreationHandler:
 
         # Also save process and relationship to session record
         session_record = session.record_dir / "record.json"
-        from flow_sdk.fs_store import Record
         rec = Record.init_record(session_record)
         # Save task under a skill-specific key so multiple skills per session don't collide
         task_key = f"task:{folder_name}"
-        rec[task_key] = task.to_dict()
-        rec[process.id] = process.to_dict()
-        rec[relationship.id] = relationship.to_dict()
+        task_dict = task.to_dict()
+        process_dict = process.to_dict()
+        relationship_dict = relationship.to_dict()
+        rec[task_key] = task_dict
+        rec[process.id] = process_dict
+        rec[relationship.id] = relationship_dict
         rec.save()
 
-        send_entity_sync(SyncOperation.CREATE, task.to_dict(), wait=True)
-        send_entity_sync(SyncOperation.CREATE, process.to_dict(), wait=True)
-        send_entity_sync(SyncOperation.CREATE, relationship.to_dict(), ResourceType.RELATIONSHIP, wait=True)
+        send_entity_sync(SyncOperation.CREATE, task_dict, wait=True)
+        send_entity_sync(SyncOperation.CREATE, process_dict, wait=True)
+        send_entity_sync(SyncOperation.CREATE, relationship_dict, ResourceType.RELATIONSHIP, wait=True)
 
         return SkillCreationResources(task=task, process=process, relationship=relationship)
 
     @staticmethod
-    def on_update(session_id, session, record_type, entity):
+    def on_update(session_id, session, record_type, entity, copy_skills=True):
         """Complete skill-creation task when the skill status is updated to 'new'.
 
         Called by the SubagentStop hook (hook_handlers/subagent_stop.py) — not
-        dispatched via entity_crud to avoid duplicate invocations.
+        dispatched via entity_crud to avoid duplicate invocations. The hook
+        passes copy_skills=False and calls copy_ready_skills once itself.
+        Returns True when the task was completed.
         """
         skill_log(f"SkillCreationHandler on_update called for session {session_id}, record_type {record_type}, status {entity.get('status')}")
         if entity.get("status") != RecordStatus.NEW:
@@ -110,8 +116,6 @@ class SkillCreationHandler:
         task_key = f"task:{folder_name}"
 
         try:
-            from flow_sdk.fs_store import Record
-
             session_record = Record.init_record(session.record_dir / "record.json")
             if task_key not in session_record:
                 skill_log(f"on_update: '{task_key}' not found in session record — skipping")
@@ -130,7 +134,9 @@ class SkillCreationHandler:
             process_data = session_record[process_ref.id]
             process = AgenticProcess.from_dict(process_data)
 
-            rel_id = f"child:task:{task_id}:agentic_process:{process_ref.id}"
+            rel_id = RelationshipRecord.make_id(
+                RelationshipType.CHILD, RecordRef(id=task_id, type=RecordType.TASK), process_ref
+            )
             if rel_id not in session_record:
                 skill_log(f"on_update: relationship {rel_id} not found in session record — skipping")
                 return
@@ -141,39 +147,56 @@ class SkillCreationHandler:
             process.state = ProcessorStatus.COMPLETE
 
             # Update in session record
-            session_record[task_key] = task.to_dict()
-            session_record[process.id] = process.to_dict()
+            task_dict = task.to_dict()
+            process_dict = process.to_dict()
+            session_record[task_key] = task_dict
+            session_record[process.id] = process_dict
             session_record.save()
 
-            send_entity_sync(SyncOperation.UPDATE, task.to_dict())
-            send_entity_sync(SyncOperation.UPDATE, process.to_dict())
+            send_entity_sync(SyncOperation.UPDATE, task_dict)
+            send_entity_sync(SyncOperation.UPDATE, process_dict)
             skill_log("Skill created.")
 
-            output_dir = session.output_dir
-            scope = entity.get("recommended_scope", "user")
-            skill_log(f"Copying skills for session {session_id} (scope={scope}) from {output_dir}")
-            copied = 0
-            for child in output_dir.iterdir():
-                has_skill_md = child.is_dir() and (child / "SKILL.md").exists()
-                skill_log(f"  checking {child.name}: is_dir={child.is_dir()}, has_SKILL.md={has_skill_md}")
-                if has_skill_md:
-                    skill = SkillRecord.init_record(child)
-                    skill_log(f"  skill.name={skill.name!r}, skill.id={skill.id!r}, folder={child.name!r}")
-                    if scope == "project" and session.cwd:
-                        dest = skill.copy_to_project(session.cwd)
-                    else:
-                        if scope == "project":
-                            skill_log(f"  WARNING: project scope requested but session has no cwd, falling back to user scope")
-                        dest = skill.copy_to_claude_user_home()
-                    copied += 1
-                    skill_log(f"  Copied skill '{skill.name}' from {child} to {dest}")
-            if copied == 0:
-                skill_log(f"No skills found to copy in {output_dir} for session {session_id}")
+            if copy_skills:
+                SkillCreationHandler.copy_ready_skills(
+                    session_id, session, entity.get("recommended_scope", "user")
+                )
 
             skill_log(f"Completed skill creation task for session {session_id}")
+            return True
         except Exception as e:
-            import traceback
             skill_log(f"Failed to complete skill creation task: {e}\n{traceback.format_exc()}")
+        return False
+
+    @staticmethod
+    def copy_ready_skills(session_id, session, scope="user", folder_names=None):
+        """Copy every ready skill (a folder with SKILL.md) in the session output_dir.
+
+        Callers that already scanned output_dir pass the ready folder_names to
+        skip a second scan.
+        """
+        output_dir = session.output_dir
+        skill_log(f"Copying skills for session {session_id} (scope={scope}) from {output_dir}")
+        skill_dirs = []
+        try:
+            if folder_names is None:
+                skill_dirs = [child for child in output_dir.iterdir() if child.is_dir() and (child / "SKILL.md").exists()]
+            else:
+                skill_dirs = [output_dir / name for name in folder_names]
+            for skill_dir in skill_dirs:
+                skill = SkillRecord.init_record(skill_dir)
+                skill_log(f"  skill.name={skill.name!r}, skill.id={skill.id!r}, folder={skill_dir.name!r}")
+                if scope == "project" and session.cwd:
+                    dest = skill.copy_to_project(session.cwd)
+                else:
+                    if scope == "project":
+                        skill_log(f"  WARNING: project scope requested but session has no cwd, falling back to user scope")
+                    dest = skill.copy_to_claude_user_home()
+                skill_log(f"  Copied skill '{skill.name}' from {skill_dir} to {dest}")
+        except Exception as e:
+            skill_log(f"Failed to copy skills: {e}\n{traceback.format_exc()}")
+        if not skill_dirs:
+            skill_log(f"No skills found to copy in {output_dir} for session {session_id}")
 
 
 skill_creation_handler = SkillCreationHandler()
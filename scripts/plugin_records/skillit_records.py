@@ -16,7 +16,9 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from flow_sdk.fs_store import ResourceRecordList, StorageLayout
+from flow_sdk.fs_store import ResourceRecordList, StorageLayout, type_registry
+from utils.conf import RECORDS_PATH
+from utils.log import skill_log
 
 from .skillit_config import SkillitConfig
 from .skillit_session import SkillitSession
@@ -36,7 +38,6 @@ class SkillitRecords:
     def _get_records_path(self) -> Path:
         if self._records_path is not None:
             return self._records_path
-        from utils.conf import RECORDS_PATH
         return RECORDS_PATH
 
     @property
@@ -93,8 +94,6 @@ class SkillitRecords:
         Returns:
             Result message string.
         """
-        from utils.log import skill_log
-
         session = self._get_or_create_session(session_id)
         record_type = entity.get("type")
 
@@ -143,9 +142,6 @@ class SkillitRecords:
         return self._stores[record_type]
 
     def _entity_create(self, session: SkillitSession, record_type: str, entity: dict) -> str:
-        from flow_sdk.fs_store import type_registry
-        from utils.log import skill_log
-
         cls = type_registry.get(record_type)
         if cls is None:
             return f"Error: unknown entity type '{record_type}'"
@@ -166,8 +162,6 @@ class SkillitRecords:
         raise NotImplementedError
 
     def _entity_update(self, session: SkillitSession, record_type: str, entity: dict) -> str:
-        from flow_sdk.fs_store import type_registry
-
         cls = type_registry.get(record_type)
         if cls is None:
             return f"Error: unknown entity type '{record_type}'"
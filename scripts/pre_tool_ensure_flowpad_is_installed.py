@@ -4,19 +4,26 @@ import json
 import shutil
 import sys
 
+# tool_name -> tool_input key naming the skill/agent being invoked
+SKILLIT_TARGET_KEYS = {
+    "Skill": "skill",
+    "Task": "subagent_type",
+}
+
 
 def _is_skillit_call(tool_name, tool_input):
     """Check if this tool call targets a skillit skill or agent."""
-    if tool_name == "Skill":
-        return tool_input.get("skill", "").startswith("skillit:")
-    if tool_name == "Task":
-        return tool_input.get("subagent_type", "").startswith("skillit:")
-    return False
+    key = SKILLIT_TARGET_KEYS.get(tool_name)
+    if key is None:
+        return False
+    return tool_input.get(key, "").startswith("skillit:")
 
 
 def main():
     raw = sys.stdin.read()
-    if not raw or not raw.strip():
+    # A skillit call always names a "skillit:" target, so every other
+    # Skill/Task invocation (and empty input) exits before decoding the payload.
+    if "skillit:" not in raw:
         sys.exit(0)
 
     try:
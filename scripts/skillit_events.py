@@ -16,8 +16,9 @@ def send_skill_activation(
     prompt: str,
     handler_name: str,
     folder_path: str,
+    wait: bool = False,
 ) -> bool:
-    """Send skill activation event to FlowPad (fire-and-forget)."""
+    """Send skill activation event to FlowPad (fire-and-forget unless *wait*)."""
     return send_resource_sync(
         type=RecordType.SKILL,
         id=str(uuid.uuid4()),
@@ -33,11 +34,12 @@ def send_skill_activation(
             },
         },
         log_context=f"skill={skill_name}",
+        wait=wait,
     )
 
 
-def send_skill_event(event_type: str, context: dict = None) -> bool:
-    """Send a skill lifecycle event to FlowPad (fire-and-forget)."""
+def send_skill_event(event_type: str, context: dict = None, wait: bool = False) -> bool:
+    """Send a skill lifecycle event to FlowPad (fire-and-forget unless *wait*)."""
     return send_resource_sync(
         type=RecordType.SKILL,
         id=str(uuid.uuid4()),
@@ -47,6 +49,7 @@ def send_skill_event(event_type: str, context: dict = None) -> bool:
             "event_data": context or {},
         },
         log_context=f"event={event_type}",
+        wait=wait,
     )
 
 
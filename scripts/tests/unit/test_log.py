@@ -0,0 +1,77 @@
+"""Tests for utils.log."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from utils import log
+from utils.conf import SCRIPT_DIR
+
+
+@pytest.fixture
+def log_file(tmp_path, monkeypatch):
+    """Point skill_log at a temp file with no stderr echo or session header."""
+    path = tmp_path / "skill.log"
+    monkeypatch.setattr(log, "LOG_FILE", path)
+    monkeypatch.setattr(log, "LOG_TO_STDERR", False)
+    monkeypatch.setattr(log, "first_line", False)
+    return path
+
+
+class _Exploding:
+    def __str__(self):
+        raise AssertionError("formatted while logging is disabled")
+
+
+class TestSkillLogArgs:
+    def test_args_are_formatted_into_message(self, log_file, monkeypatch):
+        monkeypatch.setattr(log, "LOG", True)
+        log.skill_log("Hook triggered: %s, pid: %d", "SessionStart", 42)
+        assert log_file.read_text(encoding="utf-8").endswith(
+            "] Hook triggered: SessionStart, pid: 42\n"
+        )
+
+    def test_literal_percent_without_args_passes_through(self, log_file, monkeypatch):
+        monkeypatch.setattr(log, "LOG", True)
+        log.skill_log("Prompt: 100% done %s")
+        assert log_file.read_text(encoding="utf-8").endswith("] Prompt: 100% done %s\n")
+
+    def test_format_mismatch_logs_raw_message_and_args(self, log_file, monkeypatch):
+        monkeypatch.setattr(log, "LOG", True)
+        log.skill_log("pid: %d", "not-a-number")
+        assert log_file.read_text(encoding="utf-8").endswith("] pid: %d ('not-a-number',)\n")
+
+    def test_args_not_formatted_when_disabled(self, log_file, monkeypatch):
+        monkeypatch.setattr(log, "LOG", False)
+        log.skill_log("value: %s", _Exploding())
+        assert not log_file.exists()
+
+
+def _log_in_subprocess(home, **env) -> subprocess.CompletedProcess:
+    """Call skill_log in a fresh interpreter so env switches are re-read."""
+    return subprocess.run(
+        [sys.executable, "-c", "from utils.log import skill_log; skill_log('hello')"],
+        cwd=SCRIPT_DIR,
+        env={**os.environ, "HOME": str(home), "USERPROFILE": str(home), **env},
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+
+class TestSkillLogEnvSwitches:
+    def test_logs_to_file_and_stderr_when_enabled(self, tmp_path):
+        result = _log_in_subprocess(tmp_path, SKILLIT_LOG="1", SKILLIT_LOG_STDERR="1")
+        assert "hello" in (tmp_path / ".flow" / "skillit" / "skill.log").read_text(encoding="utf-8")
+        assert "hello" in result.stderr
+
+    def test_skillit_log_zero_writes_nothing(self, tmp_path):
+        _log_in_subprocess(tmp_path, SKILLIT_LOG="0")
+        assert not (tmp_path / ".flow" / "skillit" / "skill.log").exists()
+
+    def test_skillit_log_stderr_zero_keeps_file_only(self, tmp_path):
+        result = _log_in_subprocess(tmp_path, SKILLIT_LOG="1", SKILLIT_LOG_STDERR="0")
+        assert "hello" in (tmp_path / ".flow" / "skillit" / "skill.log").read_text(encoding="utf-8")
+        assert "hello" not in result.stderr
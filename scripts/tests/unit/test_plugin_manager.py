@@ -0,0 +1,30 @@
+"""Tests for utils.plugin_manager."""
+
+import json
+
+import pytest
+
+from utils import plugin_manager
+from utils.plugin_manager import SkillitPluginManager
+
+
+class TestWriteJson:
+    def test_writes_indented_json(self, tmp_path):
+        path = tmp_path / "plugin.json"
+        SkillitPluginManager._write_json(path, {"version": "1.2.3"})
+        assert json.loads(path.read_text()) == {"version": "1.2.3"}
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_failed_replace_removes_temp_file(self, tmp_path, monkeypatch):
+        path = tmp_path / "plugin.json"
+        path.write_text('{"version": "1.2.3"}\n')
+
+        def _fail(src, dst):
+            raise OSError("replace failed")
+
+        monkeypatch.setattr(plugin_manager.os, "replace", _fail)
+        with pytest.raises(OSError):
+            SkillitPluginManager._write_json(path, {"version": "1.2.4"})
+
+        assert list(tmp_path.iterdir()) == [path]
+        assert json.loads(path.read_text()) == {"version": "1.2.3"}
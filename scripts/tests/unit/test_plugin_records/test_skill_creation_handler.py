@@ -141,7 +141,7 @@ class TestOnUpdate:
 
     @patch("plugin_records.crud_handlers.skill_creation_handler.send_entity_sync")
     def test_on_update_copies_multiple_skills(self, mock_sync, records_env):
-        """on_update should copy all skill folders from output_dir."""
+        """Each skill's on_update copies every ready skill folder from output_dir."""
         session = records_env["session"]
         session_id = records_env["session_id"]
         skill_name = records_env["skill_name"]
@@ -173,6 +173,31 @@ class TestOnUpdate:
         assert (tmp_path / ".claude" / "skills" / "my-test-skill" / "SKILL.md").exists()
         assert (tmp_path / ".claude" / "skills" / "second-skill" / "SKILL.md").exists()
 
+    @patch("plugin_records.crud_handlers.skill_creation_handler.send_entity_sync")
+    def test_on_update_copies_ready_sibling_without_task(self, mock_sync, records_env):
+        """A ready skill with no task entry (creator renamed its folder) is still installed."""
+        session = records_env["session"]
+        session_id = records_env["session_id"]
+        skill_name = records_env["skill_name"]
+        tmp_path = records_env["tmp_path"]
+
+        renamed_dir = session.output_dir / "renamed-skill"
+        renamed_dir.mkdir(parents=True, exist_ok=True)
+        (renamed_dir / "SKILL.md").write_text(
+            "---\nname: renamed-skill\ndescription: Renamed by the creator\n---\n# Renamed\n"
+        )
+
+        skill_creation_handler.on_create(
+            session_id, session, RecordType.SKILL, {"type": "skill", "name": skill_name}
+        )
+
+        with patch("flow_sdk.fs_records.skill_record.Path.home", return_value=tmp_path):
+            skill_creation_handler.on_update(
+                session_id, session, RecordType.SKILL, {"status": "new", "folder_name": skill_name}
+            )
+
+        assert (tmp_path / ".claude" / "skills" / "renamed-skill" / "SKILL.md").exists()
+
     @patch("plugin_records.crud_handlers.skill_creation_handler.send_entity_sync")
     def test_on_update_ignores_non_skill_dirs(self, mock_sync, records_env):
         """Directories without SKILL.md should be ignored."""
@@ -202,6 +227,43 @@ class TestOnUpdate:
         assert not (tmp_path / ".claude" / "skills" / "not-a-skill").exists()
 
 
+class TestSubagentStop:
+    """Test that SubagentStop completes every task but copies skills once."""
+
+    @patch("plugin_records.crud_handlers.skill_creation_handler.send_entity_sync")
+    def test_subagent_stop_copies_ready_skills_once(self, mock_sync, records_env):
+        from hook_handlers import subagent_stop
+
+        session = records_env["session"]
+        session_id = records_env["session_id"]
+        skill_name = records_env["skill_name"]
+        tmp_path = records_env["tmp_path"]
+
+        second_skill_dir = session.output_dir / "second-skill"
+        second_skill_dir.mkdir(parents=True, exist_ok=True)
+        (second_skill_dir / "SKILL.md").write_text(
+            "---\nname: second-skill\ndescription: Another skill\n---\n# Second\n"
+        )
+        skill_creation_handler.on_create(
+            session_id, session, RecordType.SKILL, {"type": "skill", "name": skill_name}
+        )
+        skill_creation_handler.on_create(
+            session_id, session, RecordType.SKILL, {"type": "skill", "name": "second-skill"}
+        )
+
+        data = {"agent_type": "skillit:skillit-creator", "session_id": session_id}
+        with patch.object(subagent_stop.skillit_records, "get_session", return_value=session), \
+                patch.object(
+                    SkillCreationHandler, "copy_ready_skills", wraps=SkillCreationHandler.copy_ready_skills
+                ) as copy_spy, \
+                patch("flow_sdk.fs_records.skill_record.Path.home", return_value=tmp_path):
+            subagent_stop.handle(data, {})
+
+        copy_spy.assert_called_once()
+        assert (tmp_path / ".claude" / "skills" / "my-test-skill" / "SKILL.md").exists()
+        assert (tmp_path / ".claude" / "skills" / "second-skill" / "SKILL.md").exists()
+
+
 class TestEntityCrudUpdate:
     """Test the entity_crud update path."""
 
@@ -0,0 +1,62 @@
+"""Tests for the PreToolUse flowpad guard script."""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from utils.conf import SCRIPT_DIR
+
+SCRIPT = SCRIPT_DIR / "pre_tool_ensure_flowpad_is_installed.py"
+
+
+def _run_guard(payload: dict, path: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, str(SCRIPT)],
+        input=json.dumps(payload),
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PATH": path},
+    )
+
+
+@pytest.fixture
+def no_flow_path(tmp_path):
+    """A PATH with no `flow` executable on it."""
+    return str(tmp_path)
+
+
+class TestFlowpadGuard:
+    def test_non_skillit_task_exits_silently(self, no_flow_path):
+        result = _run_guard(
+            {"tool_name": "Task", "tool_input": {"subagent_type": "general-purpose"}},
+            no_flow_path,
+        )
+        assert result.returncode == 0
+        assert result.stdout == ""
+
+    def test_skillit_mention_outside_target_does_not_block(self, no_flow_path):
+        result = _run_guard(
+            {
+                "tool_name": "Task",
+                "tool_input": {
+                    "subagent_type": "general-purpose",
+                    "prompt": "Explain what skillit:test does",
+                },
+            },
+            no_flow_path,
+        )
+        assert result.returncode == 0
+        assert result.stdout == ""
+
+    def test_skillit_skill_blocks_when_flow_missing(self, no_flow_path):
+        result = _run_guard(
+            {"tool_name": "Skill", "tool_input": {"skill": "skillit:test"}},
+            no_flow_path,
+        )
+        assert result.returncode == 0
+        output = json.loads(result.stdout)
+        assert output["decision"] == "block"
+        assert "flow" in output["reason"]
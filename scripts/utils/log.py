@@ -2,6 +2,8 @@
 Skillit - Logging Module
 Provides centralized logging functionality for all scripts.
 """
+import os
+import sys
 from datetime import datetime
 
 from utils.conf import SCRIPT_DIR, LOG_FILE, SKILLIT_HOME
@@ -10,18 +12,28 @@ from utils.conf import SCRIPT_DIR, LOG_FILE, SKILLIT_HOME
 # CONFIGURATION
 # =============================================================================
 
-LOG = True  # Set to False to disable logging
-LOG_TO_STDERR = True  # Use stderr so logs don't pollute hook stdout
+LOG = os.environ.get("SKILLIT_LOG", "1") != "0"  # SKILLIT_LOG=0 disables logging
+LOG_TO_STDERR = os.environ.get("SKILLIT_LOG_STDERR", "1") != "0"  # Use stderr so logs don't pollute hook stdout
 first_line = True
 # =============================================================================
 # LOGGING
 # =============================================================================
 
-def skill_log(message: str) -> None:
-    """Append log message to skill.log if LOG is enabled."""
+def skill_log(message: str, *args) -> None:
+    """Append log message to skill.log if LOG is enabled.
+
+    Extra *args* are %-formatted into *message* only when logging is on, so
+    hot call sites can pass values instead of building f-strings.
+    """
     global first_line
     if not LOG:
         return
+    if args:
+        try:
+            message = message % args
+        except (TypeError, ValueError):
+            # Like stdlib logging, a bad format string must not crash the hook
+            message = f"{message} {args!r}"
     if first_line:
         first_line = False
         SKILLIT_HOME.mkdir(parents=True, exist_ok=True)
@@ -30,7 +42,6 @@ def skill_log(message: str) -> None:
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     log_line = f"[{timestamp}] {message}\n"
     if LOG_TO_STDERR:
-        import sys
         sys.stderr.write(log_line)
     with open(LOG_FILE, "a", encoding="utf-8") as f:
         f.write(log_line)
@@ -38,17 +49,17 @@ def skill_log(message: str) -> None:
 
 def skill_log_print() -> None:
     """Print the contents of the log file to stdout."""
-    if LOG_FILE.exists():
+    try:
         log_contents = LOG_FILE.read_text(encoding="utf-8")
-        if log_contents:
-            print(log_contents, end="")
-        else:
-            print("[Skillit Log is empty]")
-    else:
+    except FileNotFoundError:
         print("[Skillit Log file does not exist]")
+        return
+    if log_contents:
+        print(log_contents, end="")
+    else:
+        print("[Skillit Log is empty]")
 
 
 def skill_log_clear() -> None:
     """Delete the log file."""
-    if LOG_FILE.exists():
-        LOG_FILE.unlink()
+    LOG_FILE.unlink(missing_ok=True)
@@ -1,9 +1,11 @@
 """Manage the skillit plugin version files."""
 
 import json
+import os
 from pathlib import Path
 
 from utils.conf import LOG_FILE, SKILLIT_HOME
+from utils.log import skill_log_clear
 from utils.template_render import render
 
 SKILLIT_ROOT = Path(__file__).resolve().parents[2]
@@ -23,17 +25,31 @@ class SkillitPluginManager:
         """Return the current plugin version."""
         return json.loads(self._plugin_json.read_text())["version"]
 
+    @staticmethod
+    def _write_json(path: Path, data: dict) -> None:
+        """Write *data* to *path* via a temp file so readers never see a partial file.
+
+        No fsync: this guards against torn reads, not against a crash losing the write.
+        """
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            tmp.write_text(json.dumps(data, indent=2) + "\n")
+            os.replace(tmp, path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+
     def _write_version(self, new_version: str) -> None:
         """Write *new_version* to both plugin.json and marketplace.json."""
         plugin = json.loads(self._plugin_json.read_text())
         plugin["version"] = new_version
-        self._plugin_json.write_text(json.dumps(plugin, indent=2) + "\n")
+        self._write_json(self._plugin_json, plugin)
 
         marketplace = json.loads(self._marketplace_json.read_text())
         for p in marketplace.get("plugins", []):
             if p["name"] == plugin["name"]:
                 p["version"] = new_version
-        self._marketplace_json.write_text(json.dumps(marketplace, indent=2) + "\n")
+        self._write_json(self._marketplace_json, marketplace)
 
     @staticmethod
     def _parse_version(version: str) -> tuple[int, int, int]:
@@ -65,31 +81,34 @@ class SkillitPluginManager:
     @staticmethod
     def clear_log() -> None:
         """Delete the skill log file if it exists."""
-        if LOG_FILE.exists():
-            LOG_FILE.unlink()
+        skill_log_clear()
 
     @staticmethod
     def print_log() -> str:
         """Return the skill log contents (also prints to stdout)."""
-        if LOG_FILE.exists():
+        try:
             text = LOG_FILE.read_text()
-            print(text, end="")
-            return text
-        print(f"No log file at {LOG_FILE}")
-        return ""
+        except FileNotFoundError:
+            print(f"No log file at {LOG_FILE}")
+            return ""
+        print(text, end="")
+        return text
 
     def build(self) -> None:
         """Render all templates in templates/ into agents/ with current plugin context."""
-        agent_common_path = TEMPLATES_DIR / "agent_common.md"
-        agent_common = agent_common_path.read_text() if agent_common_path.exists() else ""
+        try:
+            agent_common = (TEMPLATES_DIR / "agent_common.md").read_text()
+        except FileNotFoundError:
+            agent_common = ""
         context = {
             "version": self.version,
             "skillit_home": str(SKILLIT_ROOT),
             "agent_common": agent_common,
         }
         AGENTS_DIR.mkdir(parents=True, exist_ok=True)
-        for template_path in TEMPLATES_DIR.glob("*.md"):
-            if template_path.name == "agent_common.md":
-                continue
-            rendered = render(template_path, context)
-            (AGENTS_DIR / template_path.name).write_text(rendered)
+        with os.scandir(TEMPLATES_DIR) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".md") or entry.name == "agent_common.md" or not entry.is_file():
+                    continue
+                rendered = render(Path(entry.path), context)
+                (AGENTS_DIR / entry.name).write_text(rendered)
@@ -133,10 +133,11 @@ def render(template: str | Path, context: dict[str, Any]) -> str:
     Returns:
         The rendered string.
     """
-    # Determine if template is a file path
+    # Determine if template is a file path. Strings holding template markup or
+    # newlines are template text, so skip the filesystem probe for them.
     if isinstance(template, Path):
         template = template.read_text(encoding="utf-8")
-    elif isinstance(template, str):
+    elif isinstance(template, str) and "{{" not in template and "\n" not in template:
         path = Path(template)
         if path.is_file():
             template = path.read_text(encoding="utf-8")
@@ -16,7 +16,6 @@ import os
 import subprocess
 import sys
 import threading
-import time
 import uuid
 from glob import glob
 from http.server import BaseHTTPRequestHandler, HTTPServer
@@ -228,17 +227,16 @@ success = send_skill_activation(
     matched_keyword="test-keyword",
     prompt="test prompt",
     handler_name="test_handler",
-    folder_path="/tmp/test"
+    folder_path="/tmp/test",
+    wait=True,
 )
 print("QUEUED:" + str(success))
-import time; time.sleep(0.5)
 """],
             capture_output=True, text=True, encoding="utf-8"
         )
         print(result.stdout)
         if result.stderr:
             print(f"stderr: {result.stderr[:200]}")
-        time.sleep(0.3)
 
         if TestServerHandler.received:
             payload = TestServerHandler.received[0]["webhook_payload"]
@@ -345,13 +343,11 @@ if status != FlowpadStatus.RUNNING:
     print("FAIL:flowpad_status=" + status)
     sys.exit(1)
 
-success = send_skill_event("skill_ready", {{"skill_name": "test-skill", "session_id": "test-123"}})
+success = send_skill_event("skill_ready", {{"skill_name": "test-skill", "session_id": "test-123"}}, wait=True)
 print("SENT:" + str(success))
-import time; time.sleep(0.5)
 """],
             capture_output=True, text=True, encoding="utf-8"
         )
-        time.sleep(0.3)
 
         if TestServerHandler.received:
             payload = TestServerHandler.received[0]["webhook_payload"]